@@ -3,11 +3,12 @@
 
 import asyncio
 import sys
-from claude_agent_sdk import query, ClaudeAgentOptions
 
 
-async def test_stream():
+async def stream_debug():
     """Test streaming with debug output."""
+    from claude_agent_sdk import query, ClaudeAgentOptions
+
     prompt = "Translate 'hello' to Japanese. Output ONLY the translation."
 
     options = ClaudeAgentOptions(
@@ -40,5 +41,10 @@ async def test_stream():
     print(f"\n=== Total messages: {message_count} ===", file=sys.stderr, flush=True)
 
 
+def main():
+    """Run the streaming debug session."""
+    asyncio.run(stream_debug())
+
+
 if __name__ == "__main__":
-    asyncio.run(test_stream())
+    main()
@@ -4,15 +4,12 @@ import argparse
 import sys
 from typing import Optional
 
-from rich.console import Console
-from rich.spinner import Spinner
-from rich.live import Live
-from rich.console import Group
-from rich.text import Text
-
 from . import __version__, __build_time__
 from .config import Config
-from .translator import Translator
+from .languages import LANGUAGE_NAMES
+
+# Set from --debug in main()
+DEBUG = False
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -53,12 +50,14 @@ Examples:
     parser.add_argument(
         "--to",
         dest="target_language",
-        help="Target language code (e.g., en, ja, zh)",
+        metavar="LANG",
+        help=f"Target language code (e.g., {', '.join(LANGUAGE_NAMES)})",
     )
 
     parser.add_argument(
         "--from",
         dest="source_language",
+        metavar="LANG",
         help="Source language code (auto-detected if not provided)",
     )
 
@@ -127,9 +126,11 @@ def show_config(config: Config) -> None:
     print(f"  Default model: {config.default_model}")
 
 
-def debug_print(message: str, debug: bool = False) -> None:
-    """Print debug message to stderr."""
-    if debug:
+def debug_print(message: str, *args: object) -> None:
+    """Print debug message to stderr, %-formatting it only when debugging is enabled."""
+    if DEBUG:
+        if args:
+            message = message % args
         print(f"DEBUG: {message}", file=sys.stderr, flush=True)
 
 
@@ -141,11 +142,19 @@ def progress_print(message: str, quiet: bool = False) -> None:
 
 def main() -> int:
     """Main entry point."""
+    # Fast path: answer a bare --version without building the argument parser
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        show_version()
+        return 0
+
     parser = create_parser()
     args = parser.parse_args()
 
-    debug_print("Starting cctr", args.debug)
-    debug_print(f"Arguments: {args}", args.debug)
+    global DEBUG
+    DEBUG = args.debug
+
+    debug_print("Starting cctr")
+    debug_print("Arguments: %s", args)
 
     # Handle version command
     if args.version:
@@ -153,9 +162,11 @@ def main() -> int:
         return 0
 
     # Load configuration
-    debug_print("Loading configuration", args.debug)
+    debug_print("Loading configuration")
     config = Config()
-    debug_print(f"Config: native_language={config.native_language}, model={config.default_model}", args.debug)
+    debug_print(
+        "Config: native_language=%s, model=%s", config.native_language, config.default_model
+    )
 
     # Handle configuration commands
     if args.show_config:
@@ -173,19 +184,20 @@ def main() -> int:
         return 0
 
     # Get input text
-    debug_print("Getting input text", args.debug)
+    debug_print("Getting input text")
     if args.text:
         text = args.text
-        debug_print(f"Input from argument: '{text}'", args.debug)
+        debug_print("Input from argument: '%s'", text)
     else:
         # Read from stdin
         if sys.stdin.isatty():
             print("Error: No input text provided", file=sys.stderr)
             print("Usage: cctr <text> or echo <text> | cctr", file=sys.stderr)
             return 1
-        debug_print("Reading from stdin", args.debug)
-        text = sys.stdin.read().strip()
-        debug_print(f"Input from stdin: '{text}'", args.debug)
+        debug_print("Reading from stdin")
+        # Read raw bytes in one go and decode once, bypassing the text wrapper
+        text = sys.stdin.buffer.read().decode(sys.stdin.encoding or "utf-8").strip()
+        debug_print("Input from stdin: '%s'", text)
 
     if not text:
         print("Error: Empty input text", file=sys.stderr)
@@ -193,19 +205,19 @@ def main() -> int:
 
     # Get model for translator
     model = args.model or config.default_model
-    debug_print(f"Using model: {model}", args.debug)
+    debug_print("Using model: %s", model)
+
+    # Imported here so config-only commands never load the translation stack
+    from .translator import Translator
 
     # Translate
     try:
-        # Show spinner while translating
-        console = Console(file=sys.stderr)
-
         if args.quiet:
             # No spinner in quiet mode
             translator_quiet = Translator(model=model, debug=args.debug, quiet=args.quiet)
             if args.target_language:
                 # Explicit target language
-                debug_print(f"Translating to: {args.target_language}", args.debug)
+                debug_print("Translating to: %s", args.target_language)
                 result = translator_quiet.translate(
                     text,
                     target_language=args.target_language,
@@ -213,28 +225,31 @@ def main() -> int:
                 )
             else:
                 # Auto-detect and translate
-                debug_print(f"Auto-translating with native language: {config.native_language}", args.debug)
+                debug_print("Auto-translating with native language: %s", config.native_language)
                 result = translator_quiet.auto_translate(text, config.native_language)
         else:
-            # State for progress updates
-            progress_messages = []
+            # rich is only needed for the spinner, so import it lazily
+            from rich.console import Console, Group
+            from rich.live import Live
+            from rich.spinner import Spinner
+            from rich.text import Text
+
+            # Show spinner while translating
+            console = Console(file=sys.stderr)
+
+            # Show animated spinner with progress updates. The renderables are
+            # built once; callbacks only store the latest message text, and
+            # Live's own refresh loop (20 fps) paces redraws and animation.
+            spinner = Spinner("dots", text="Translating...", style="cyan")
+            progress_text = Text(style="dim")
+            display = Group(spinner, progress_text)
 
             def progress_callback(message: str, cost: Optional[float]) -> None:
                 """Update progress display."""
-                progress_messages.clear()
-                progress_messages.append(Text(f"  {message}", style="dim"))
-
-                # Update live display
-                spinner = Spinner("dots", text="Translating...", style="cyan")
-                if progress_messages:
-                    display = Group(spinner, *progress_messages)
-                else:
-                    display = spinner
+                progress_text.plain = f"  {message}"
                 live.update(display)
 
-            # Show animated spinner with progress updates
-            spinner = Spinner("dots", text="Translating...", style="cyan")
-            with Live(spinner, console=console, transient=True) as live:
+            with Live(spinner, console=console, transient=True, refresh_per_second=20) as live:
                 # Create translator with progress callback
                 translator_with_progress = Translator(
                     model=model,
@@ -245,7 +260,7 @@ def main() -> int:
 
                 if args.target_language:
                     # Explicit target language
-                    debug_print(f"Translating to: {args.target_language}", args.debug)
+                    debug_print("Translating to: %s", args.target_language)
                     result = translator_with_progress.translate(
                         text,
                         target_language=args.target_language,
@@ -253,13 +268,13 @@ def main() -> int:
                     )
                 else:
                     # Auto-detect and translate
-                    debug_print(f"Auto-translating with native language: {config.native_language}", args.debug)
+                    debug_print("Auto-translating with native language: %s", config.native_language)
                     result = translator_with_progress.auto_translate(text, config.native_language)
 
             # Show completion message
             console.print("✓ Translation complete", style="green")
 
-        debug_print(f"Translation completed: '{result}'", args.debug)
+        debug_print("Translation completed: '%s'", result)
 
         # Output to stdout
         print(result, flush=True)
@@ -1,12 +1,11 @@
 """Configuration management with XDG Base Directory support."""
 
-import locale
+import functools
+import json
 import os
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 
 def get_xdg_config_home() -> Path:
     """Get XDG_CONFIG_HOME directory."""
@@ -18,29 +17,48 @@ def get_xdg_data_home() -> Path:
     return Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get cctr configuration directory."""
+    """Get cctr configuration directory, creating it on first use."""
     config_dir = get_xdg_config_home() / "cctr"
-    config_dir.mkdir(parents=True, exist_ok=True)
+    if not config_dir.exists():
+        config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
 def get_config_file() -> Path:
     """Get cctr configuration file path."""
+    return get_config_dir() / "config.json"
+
+
+def get_legacy_config_file() -> Path:
+    """Get path of the YAML configuration file used by older versions."""
     return get_config_dir() / "config.yaml"
 
 
+def _load_legacy_config(path: Path) -> dict:
+    """Load a legacy YAML configuration file."""
+    # PyYAML is only needed for this one-time migration
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=Loader) or {}
+
+
+@functools.lru_cache(maxsize=1)
 def get_system_language() -> str:
     """Get system default language code."""
-    try:
-        # Get the system locale
-        lang, _ = locale.getdefaultlocale()
-        if lang:
-            # Extract language code (e.g., 'ja_JP' -> 'ja')
-            return lang.split("_")[0]
-        return "en"
-    except Exception:
+    # Same precedence as POSIX locale resolution, without importing locale
+    lang = os.environ.get("LC_ALL") or os.environ.get("LC_MESSAGES") or os.environ.get("LANG") or ""
+    # Extract language code (e.g., 'ja_JP.UTF-8' -> 'ja', 'sr@latin' -> 'sr')
+    code = lang.split(".")[0].split("@")[0].split("_")[0]
+    if not code or code in ("C", "POSIX"):
         return "en"
+    return code
 
 
 class Config:
@@ -48,31 +66,40 @@ class Config:
 
     def __init__(self):
         self.config_file = get_config_file()
+        self._native_default = get_system_language()
         self._config = self._load_config()
 
     def _load_config(self) -> dict:
         """Load configuration from file or create default."""
         if self.config_file.exists():
             with open(self.config_file, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        else:
-            # Create default config
-            default_config = {
-                "native_language": get_system_language(),
-                "default_model": "haiku",
-            }
-            self._save_config(default_config)
-            return default_config
+                return json.load(f) or {}
+
+        legacy_file = get_legacy_config_file()
+        if legacy_file.exists():
+            # Migrate config.yaml from older versions to config.json
+            config = _load_legacy_config(legacy_file)
+            self._save_config(config)
+            return config
+
+        # Create default config
+        default_config = {
+            "native_language": self._native_default,
+            "default_model": "haiku",
+        }
+        self._save_config(default_config)
+        return default_config
 
     def _save_config(self, config: dict) -> None:
         """Save configuration to file."""
         with open(self.config_file, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, allow_unicode=True, default_flow_style=False)
+            json.dump(config, f, ensure_ascii=False, indent=2)
+            f.write("\n")
 
     @property
     def native_language(self) -> str:
         """Get native language setting."""
-        return self._config.get("native_language", get_system_language())
+        return self._config.get("native_language", self._native_default)
 
     @native_language.setter
     def native_language(self, value: str) -> None:
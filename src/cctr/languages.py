@@ -0,0 +1,19 @@
+"""Language codes known to cctr."""
+
+from types import MappingProxyType
+
+# Language code to full name mapping
+LANGUAGE_NAMES = MappingProxyType(
+    {
+        "en": "English",
+        "ja": "Japanese",
+        "zh": "Chinese",
+        "ko": "Korean",
+        "es": "Spanish",
+        "fr": "French",
+        "de": "German",
+        "it": "Italian",
+        "pt": "Portuguese",
+        "ru": "Russian",
+    }
+)
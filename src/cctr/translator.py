@@ -1,19 +1,36 @@
 """Translation core functionality using Claude Agent SDK."""
 
 import asyncio
+import functools
+import re
 import sys
-from typing import Callable, Optional
-
-from claude_agent_sdk import (
-    AssistantMessage,
-    ClaudeAgentOptions,
-    ClaudeSDKClient,
-    ResultMessage,
-    TextBlock,
-    ToolUseBlock,
-    UserMessage,
+from collections import deque
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .languages import LANGUAGE_NAMES as _LANGUAGE_NAMES
+
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+
+# Model aliases
+_MODEL_ALIASES = MappingProxyType(
+    {
+        "haiku": "claude-3-5-haiku-20241022",
+        "sonnet": "claude-3-5-sonnet-20241022",
+        "opus": "claude-opus-4-20250514",
+    }
 )
 
+# Japanese characters: Hiragana, Katakana and CJK Unified Ideographs (Kanji)
+_JA_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff]")
+
+# Maximum length of the streaming progress preview
+_PREVIEW_LEN = 50
+
+# Inputs longer than this are not memoized to keep the cache bounded
+_DETECT_CACHE_MAX_LEN = 4096
+
 
 class LanguageDetector:
     """Detect the language of input text."""
@@ -27,45 +44,28 @@ class LanguageDetector:
         - If contains Japanese characters (Hiragana, Katakana, Kanji), return 'ja'
         - Otherwise, return 'en'
         """
-        # Check for Japanese characters
-        japanese_ranges = [
-            (0x3040, 0x309F),  # Hiragana
-            (0x30A0, 0x30FF),  # Katakana
-            (0x4E00, 0x9FFF),  # CJK Unified Ideographs (Kanji)
-        ]
+        # Pure ASCII text cannot contain Japanese characters
+        if text.isascii():
+            return "en"
+        if len(text) < _DETECT_CACHE_MAX_LEN:
+            return LanguageDetector._detect_cached(text)
+        return "ja" if _JA_RE.search(text) else "en"
 
-        for char in text:
-            code = ord(char)
-            for start, end in japanese_ranges:
-                if start <= code <= end:
-                    return "ja"
-
-        return "en"
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _detect_cached(text: str) -> str:
+        """Memoized detection for short inputs."""
+        return "ja" if _JA_RE.search(text) else "en"
 
 
 class Translator:
     """Translation service using Claude Agent SDK."""
 
     # Model aliases
-    MODEL_ALIASES = {
-        "haiku": "claude-3-5-haiku-20241022",
-        "sonnet": "claude-3-5-sonnet-20241022",
-        "opus": "claude-opus-4-20250514",
-    }
+    MODEL_ALIASES = _MODEL_ALIASES
 
     # Language code to full name mapping
-    LANGUAGE_NAMES = {
-        "en": "English",
-        "ja": "Japanese",
-        "zh": "Chinese",
-        "ko": "Korean",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "ru": "Russian",
-    }
+    LANGUAGE_NAMES = _LANGUAGE_NAMES
 
     def __init__(
         self,
@@ -88,27 +88,23 @@ class Translator:
             No API key is required if Claude Code is authenticated
             (via subscription or API key).
         """
-        self.model = self._resolve_model(model)
+        self.model = _MODEL_ALIASES.get(model, model)  # Resolve alias to full model name
         self.debug = debug
         self.quiet = quiet
         self.progress_callback = progress_callback
 
-    def _resolve_model(self, model: str) -> str:
-        """Resolve model alias to full model name."""
-        return self.MODEL_ALIASES.get(model, model)
-
     def _get_language_name(self, code: str) -> str:
         """Get full language name from language code."""
-        return self.LANGUAGE_NAMES.get(code, code)
+        return _LANGUAGE_NAMES.get(code, code)
 
-    def translate(
+    def build_prompt(
         self,
         text: str,
         target_language: str,
         source_language: Optional[str] = None,
     ) -> str:
         """
-        Translate text to target language.
+        Build the translation prompt sent to Claude.
 
         Args:
             text: Text to translate
@@ -116,7 +112,7 @@ class Translator:
             source_language: Source language code (auto-detected if not provided)
 
         Returns:
-            Translated text
+            Translation prompt
         """
         # Auto-detect source language if not provided
         if source_language is None:
@@ -125,13 +121,31 @@ class Translator:
         target_lang_name = self._get_language_name(target_language)
         source_lang_name = self._get_language_name(source_language)
 
-        # Build prompt
-        prompt = f"""Translate the following text from {source_lang_name} to {target_lang_name}.
+        return f"""Translate the following text from {source_lang_name} to {target_lang_name}.
 Output ONLY the translation, without any explanations, comments, or additional text.
 
 Text to translate:
 {text}"""
 
+    def translate(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None,
+    ) -> str:
+        """
+        Translate text to target language.
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (auto-detected if not provided)
+
+        Returns:
+            Translated text
+        """
+        prompt = self.build_prompt(text, target_language, source_language)
+
         if self.debug:
             print(f"DEBUG: About to call _translate_async", file=sys.stderr, flush=True)
 
@@ -143,101 +157,163 @@ Text to translate:
 
         return result
 
-    async def _translate_async(self, prompt: str) -> str:
+    def run_many(
+        self,
+        texts: list[str],
+        target_language: str,
+        source_language: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Translate several texts on one event loop.
+
+        Each text gets its own SDK session, so translations stay independent
+        of each other.
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (auto-detected per text if not provided)
+
+        Returns:
+            Translated texts, in the same order as texts
+        """
+        prompts = [self.build_prompt(text, target_language, source_language) for text in texts]
+        return asyncio.run(self._run_many_async(prompts))
+
+    async def _run_many_async(self, prompts: list[str]) -> list[str]:
+        """Translate prompts sequentially, each with its own ClaudeSDKClient."""
+        return [await self._translate_async(prompt) for prompt in prompts]
+
+    def _build_options(self) -> "ClaudeAgentOptions":
+        """Build Claude Agent SDK options for translation."""
+        from claude_agent_sdk import ClaudeAgentOptions
+
+        return ClaudeAgentOptions(
+            model=self.model,
+            permission_mode="bypassPermissions",  # Auto-approve tool use for translation
+        )
+
+    async def _translate_async(
+        self, prompt: str, client: Optional["ClaudeSDKClient"] = None
+    ) -> str:
         """
         Async translation using Claude Agent SDK with streaming progress.
 
         Args:
             prompt: Translation prompt
+            client: Connected ClaudeSDKClient to reuse (a new one is opened if omitted)
 
         Returns:
             Translated text
         """
-        options = ClaudeAgentOptions(
-            model=self.model,
-            permission_mode="bypassPermissions",  # Auto-approve tool use for translation
+        # Deferred so that importing this module stays cheap
+        from claude_agent_sdk import (
+            AssistantMessage,
+            ClaudeSDKClient,
+            ResultMessage,
+            TextBlock,
+            ToolUseBlock,
+            UserMessage,
         )
 
+        if client is None:
+            async with ClaudeSDKClient(options=self._build_options()) as client:
+                return await self._translate_async(prompt, client)
+
         # Collect all assistant messages
         assistant_messages = []
         message_count = 0
         tool_uses = []
         total_cost = None
-        accumulated_text = ""  # For streaming preview
-
-        async with ClaudeSDKClient(options=options) as client:
-            # Send query
-            await client.query(prompt)
-
-            # Receive and process messages
-            async for message in client.receive_messages():
-                message_count += 1
-                class_name = message.__class__.__name__
-
-                # Debug: Output detailed stream information
-                if self.debug:
-                    print(f"\n[DEBUG] Message #{message_count}: {class_name}", file=sys.stderr, flush=True)
-
-                # Process AssistantMessage
-                if isinstance(message, AssistantMessage):
-                    text_blocks = []
-                    for block in message.content:
-                        # Handle text blocks
-                        if isinstance(block, TextBlock):
-                            text_blocks.append(block.text)
-                            accumulated_text += block.text
-
-                            # Send progress update via callback
-                            if self.progress_callback and not self.quiet:
-                                preview = accumulated_text.strip()
-                                if len(preview) > 50:
-                                    preview = preview[:47] + "..."
-                                self.progress_callback(f"Translating: {preview}", None)
-
-                            if self.debug:
-                                preview = block.text[:50] + "..." if len(block.text) > 50 else block.text
-                                print(f"  [TEXT] {preview}", file=sys.stderr, flush=True)
-
-                        # Handle tool use blocks
-                        elif isinstance(block, ToolUseBlock):
-                            tool_uses.append(block.name)
-
-                            # Send tool usage update via callback
-                            if self.progress_callback and not self.quiet:
-                                self.progress_callback(f"Using tool: {block.name}", None)
-
-                            if self.debug:
-                                print(f"\n  [TOOL] {block.name} (id: {block.id})", file=sys.stderr, flush=True)
-                                if block.name == "Bash" and hasattr(block, 'input'):
-                                    cmd = block.input.get('command', '')
-                                    print(f"    Command: {cmd}", file=sys.stderr, flush=True)
-
-                    if text_blocks:
-                        assistant_messages.append("".join(text_blocks))
-
-                # Process ResultMessage (completion indicator)
-                elif isinstance(message, ResultMessage):
-                    if hasattr(message, 'total_cost_usd') and message.total_cost_usd:
-                        total_cost = message.total_cost_usd
-
-                    # Send completion update via callback
-                    if self.progress_callback and not self.quiet:
-                        if total_cost and total_cost > 0:
-                            self.progress_callback(f"Translation complete (Cost: ${total_cost:.6f})", total_cost)
-                        else:
-                            self.progress_callback("Translation complete", total_cost)
-
-                    if self.debug:
-                        print(f"\n  [RESULT] Translation complete", file=sys.stderr, flush=True)
-                        if total_cost:
-                            print(f"  [COST] ${total_cost:.6f}", file=sys.stderr, flush=True)
-
-                    break  # Exit loop on result
-
-                # Process UserMessage (may contain tool results)
-                elif isinstance(message, UserMessage):
-                    if self.debug:
-                        print(f"  [USER] User message received", file=sys.stderr, flush=True)
+        # Streaming preview: only the last _PREVIEW_LEN characters are kept
+        preview_tail: deque = deque(maxlen=_PREVIEW_LEN)
+        accumulated_len = 0
+
+        # Resolve per-message predicates once
+        debug = self.debug
+        callback = None if self.quiet else self.progress_callback
+        track_tools = debug or callback is not None
+
+        # Send query
+        await client.query(prompt)
+
+        # Receive and process messages
+        async for message in client.receive_messages():
+            message_count += 1
+            class_name = message.__class__.__name__
+
+            # Debug: Output detailed stream information
+            if debug:
+                print(
+                    f"\n[DEBUG] Message #{message_count}: {class_name}", file=sys.stderr, flush=True
+                )
+
+            # Process AssistantMessage
+            if isinstance(message, AssistantMessage):
+                text_blocks = []
+                for block in message.content:
+                    # Handle text blocks
+                    if isinstance(block, TextBlock):
+                        text_blocks.append(block.text)
+                        preview_tail.extend(block.text)
+                        accumulated_len += len(block.text)
+
+                        # Send progress update via callback
+                        if callback:
+                            preview = "".join(preview_tail).strip()
+                            if accumulated_len > _PREVIEW_LEN:
+                                preview = "..." + preview[3 - _PREVIEW_LEN :]
+                            callback(f"Translating: {preview}", None)
+
+                        if debug:
+                            preview = (
+                                block.text[:50] + "..." if len(block.text) > 50 else block.text
+                            )
+                            print(f"  [TEXT] {preview}", file=sys.stderr, flush=True)
+
+                    # Handle tool use blocks
+                    elif track_tools and isinstance(block, ToolUseBlock):
+                        tool_uses.append(block.name)
+
+                        # Send tool usage update via callback
+                        if callback:
+                            callback(f"Using tool: {block.name}", None)
+
+                        if debug:
+                            print(
+                                f"\n  [TOOL] {block.name} (id: {block.id})",
+                                file=sys.stderr,
+                                flush=True,
+                            )
+                            if block.name == "Bash" and hasattr(block, "input"):
+                                cmd = block.input.get("command", "")
+                                print(f"    Command: {cmd}", file=sys.stderr, flush=True)
+
+                if text_blocks:
+                    assistant_messages.append("".join(text_blocks))
+
+            # Process ResultMessage (completion indicator)
+            elif isinstance(message, ResultMessage):
+                if hasattr(message, "total_cost_usd") and message.total_cost_usd:
+                    total_cost = message.total_cost_usd
+
+                # Send completion update via callback
+                if callback:
+                    if total_cost and total_cost > 0:
+                        callback(f"Translation complete (Cost: ${total_cost:.6f})", total_cost)
+                    else:
+                        callback("Translation complete", total_cost)
+
+                if debug:
+                    print(f"\n  [RESULT] Translation complete", file=sys.stderr, flush=True)
+                    if total_cost:
+                        print(f"  [COST] ${total_cost:.6f}", file=sys.stderr, flush=True)
+
+                break  # Exit loop on result
+
+            # Process UserMessage (may contain tool results)
+            elif debug and isinstance(message, UserMessage):
+                print(f"  [USER] User message received", file=sys.stderr, flush=True)
 
         if self.debug:
             print(f"\n[DEBUG] Total messages: {message_count}", file=sys.stderr, flush=True)